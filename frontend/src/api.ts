@@ -492,6 +492,8 @@ export async function optimize(params: {
   session_template_id?: string;
   session_photo_data_url?: string;
   session_analyze?: Record<string, unknown>;
+  /** Inline PDF as base64 in the response; default: fetch via downloadUrl(pdf_filename). */
+  include_pdf_base64?: boolean;
 }): Promise<OptimizeResponse> {
   if (isAdminPipelineCaptureEnabled()) {
     appendAdminPipelineLog({
@@ -521,7 +523,7 @@ export async function optimize(params: {
         success: data.success,
         validation_passed: data.validation?.passed,
         error: data.error,
-        has_pdf: Boolean(data.pdf_base64),
+        has_pdf: Boolean(data.pdf_base64 || data.pdf_filename),
       },
     });
   }
@@ -570,6 +572,7 @@ export async function optimizeStream(
     session_template_id?: string;
     session_photo_data_url?: string;
     session_analyze?: Record<string, unknown>;
+    include_pdf_base64?: boolean;
   },
   onProgress: (percent: number, message: string) => void
 ): Promise<OptimizeResponse> {
@@ -643,7 +646,7 @@ export async function optimizeStream(
                 data: {
                   success: payload.result.success,
                   validation_passed: payload.result.validation?.passed,
-                  has_pdf: Boolean(payload.result.pdf_base64),
+                  has_pdf: Boolean(payload.result.pdf_base64 || payload.result.pdf_filename),
                   error: payload.result.error,
                   filters:
                     payload.result.validation?.results?.map((x) => ({
@@ -2428,6 +2428,15 @@ export default function Optimize() {
         }
         return;
       }
+      if (result?.pdf_filename) {
+        const a = document.createElement("a");
+        a.href = api.downloadUrl(result.pdf_filename, api.getStoredToken());
+        a.download = result.pdf_filename;
+        document.body.appendChild(a);
+        a.click();
+        a.remove();
+        return;
+      }
 
       setError(t("optimize.downloadSchemaMissing"));
     } catch (e) {
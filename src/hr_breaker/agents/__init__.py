@@ -1,4 +1,4 @@
-from .job_parser import parse_job_posting
+from .job_parser import parse_job_posting, parse_job_postings_batch
 from .optimizer import optimize_resume
 from .combined_reviewer import combined_review, compute_ats_score
 from .name_extractor import extract_name
@@ -14,6 +14,7 @@ from .resume_schema_extractor import extract_resume_schema, extract_resume_schem
 
 __all__ = [
     "parse_job_posting",
+    "parse_job_postings_batch",
     "optimize_resume",
     "combined_review",
     "compute_ats_score",
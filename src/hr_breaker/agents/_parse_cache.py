@@ -0,0 +1,23 @@
+"""Cache keys and limits for LLM parse results (see hr_breaker.services.single_flight).
+
+Identical job text parsed twice (e.g. /job/parse preview, then /optimize) returns the first
+result without a second LLM round trip; concurrent callers for the same key await one call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+PARSE_CACHE_MAXSIZE = 256
+PARSE_CACHE_TTL_SECONDS = 3600.0
+
+
+def cache_key(model: str, system_prompt: str, text: str) -> str:
+    """Stable key over everything that determines the LLM output."""
+    payload = json.dumps(
+        {"model": model, "system_prompt": system_prompt, "text": text},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
@@ -187,9 +187,9 @@ async def combined_review(
     content = optimized.html if optimized.html is not None else optimized.data
     try:
         if isinstance(content, str):
-            render_result = renderer.render(content)
+            render_result = await renderer.render_async(content)
         else:
-            render_result = renderer.render_data(content)
+            render_result = await renderer.render_data_async(content)
         pdf_bytes = render_result.pdf_bytes
         render_warnings = render_result.warnings
         page_count = render_result.page_count
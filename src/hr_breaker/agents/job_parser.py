@@ -1,10 +1,16 @@
+import asyncio
+import sys
+import time
 from functools import lru_cache
 
-from pydantic_ai import Agent
+from pydantic_ai import Agent, NativeOutput
+from pydantic_ai.exceptions import ModelHTTPError
 
-from hr_breaker.config import get_model_settings, get_settings
+from hr_breaker.config import get_model_settings, get_settings, logger
+from hr_breaker.agents._parse_cache import PARSE_CACHE_MAXSIZE, PARSE_CACHE_TTL_SECONDS, cache_key
 from hr_breaker.agents.model import gemini_model
 from hr_breaker.models import JobPosting
+from hr_breaker.services.single_flight import SingleFlightCache
 
 LEGACY_SYSTEM_PROMPT = """You are a job posting parser. Extract ONLY what is explicitly stated in the text.
 
@@ -21,7 +27,11 @@ Rules (strict):
 Output schema: title (str), company (str), requirements (list of str), keywords (list of str), description (str). Use empty string or empty list when not in source.
 """
 
-SYSTEM_PROMPT = """You are a job posting parser. Extract ONLY what is explicitly stated in the text.
+# Keep this prompt fully static and send the job text as the entire user message:
+# Gemini implicit caching only hits when the request prefix is byte-identical across calls.
+# Add future few-shot examples or schema notes here, never interleaved with per-call text.
+SYSTEM_PROMPT = """You are a job posting parser. The user message is the raw text of one job posting.
+Extract ONLY what is explicitly stated in the text.
 
 Goal: maximize downstream resume-to-job matching quality in one pass while staying factual.
 
@@ -51,6 +61,14 @@ description:
 Output schema: title (str), company (str), requirements (list of str), keywords (list of str), description (str). Use empty string or empty list when not in source.
 """
 
+# Same rules, several postings per request: the system prompt is prefilled once for the batch.
+BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT.replace(
+    "The user message is the raw text of one job posting.",
+    'The user message contains several job postings, each introduced by "Posting <n>:".\n'
+    "Parse each posting independently and return exactly one result per posting, in input order.",
+    1,
+)
+
 
 @lru_cache
 def get_job_parser_agent() -> Agent:
@@ -63,24 +81,150 @@ def get_job_parser_agent() -> Agent:
     )
 
 
+@lru_cache
+def get_cached_job_parser_agent() -> Agent:
+    """Job parser for use with ``google_cached_content``: SYSTEM_PROMPT lives in the cache.
+
+    Gemini rejects system_instruction/tools next to cached_content, so this agent has no
+    system prompt and uses native JSON output instead of the default output tool.
+    """
+    settings = get_settings()
+    return Agent(
+        gemini_model(settings.gemini_flash_model),
+        output_type=NativeOutput(JobPosting),
+        model_settings=get_model_settings(),
+    )
+
+
+@lru_cache
+def get_batch_job_parser_agent() -> Agent:
+    settings = get_settings()
+    return Agent(
+        gemini_model(settings.gemini_flash_model),
+        output_type=list[JobPosting],
+        system_prompt=BATCH_SYSTEM_PROMPT,
+        model_settings=get_model_settings(),
+    )
+
+
+# Explicit context cache: model -> (cachedContents/... name, local expiry in monotonic seconds)
+_EXPLICIT_CACHE_RETRY_AFTER = 600  # after a failed create, use inline prompt for 10 minutes
+_explicit_cache: dict[str, tuple[str, float]] = {}
+_explicit_cache_failed_at: dict[str, float] = {}
+# asyncio.Lock binds to the loop that first waits on it; Streamlit and the API run separate loops.
+_explicit_cache_lock: tuple[asyncio.AbstractEventLoop, asyncio.Lock] | None = None
+
+
+def _get_explicit_cache_lock() -> asyncio.Lock:
+    """Create-once lock for the running loop (recreated if called from a different loop)."""
+    global _explicit_cache_lock
+    loop = asyncio.get_running_loop()
+    if _explicit_cache_lock is None or _explicit_cache_lock[0] is not loop:
+        _explicit_cache_lock = (loop, asyncio.Lock())
+    return _explicit_cache_lock[1]
+
+
+async def _get_explicit_cache_name(model: str) -> str | None:
+    """Return the Gemini cached-content name holding SYSTEM_PROMPT, creating it lazily.
+
+    Returns None when explicit caching is disabled or unavailable (caller sends the prompt inline).
+    """
+    settings = get_settings()
+    if not settings.gemini_explicit_cache or not settings.google_api_key:
+        return None
+    now = time.monotonic()
+    entry = _explicit_cache.get(model)
+    if entry and entry[1] > now:
+        return entry[0]
+    if now - _explicit_cache_failed_at.get(model, float("-inf")) < _EXPLICIT_CACHE_RETRY_AFTER:
+        return None
+    async with _get_explicit_cache_lock():
+        entry = _explicit_cache.get(model)
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+        ttl = max(60, settings.gemini_explicit_cache_ttl_seconds)
+        try:
+            from google import genai
+            from google.genai import types
+
+            client = genai.Client(api_key=settings.google_api_key)
+            cached = await client.aio.caches.create(
+                model=gemini_model(model).partition(":")[2],
+                config=types.CreateCachedContentConfig(
+                    display_name="hr-breaker-job-parser",
+                    system_instruction=SYSTEM_PROMPT,
+                    ttl=f"{ttl}s",
+                ),
+            )
+        except Exception as e:
+            logger.warning("Job parser explicit cache unavailable, using inline prompt: %s", e)
+            _explicit_cache_failed_at[model] = time.monotonic()
+            return None
+        # Refresh slightly before the server-side TTL so requests never race expiry.
+        _explicit_cache[model] = (cached.name, time.monotonic() + ttl * 0.9)
+        return cached.name
+
+
+async def _run_job_parser(text: str, model: str):
+    """Run the parser via the explicit cache when available, else with the inline system prompt."""
+    cache_name = await _get_explicit_cache_name(model)
+    if cache_name:
+        try:
+            return await get_cached_job_parser_agent().run(
+                text, model_settings={"google_cached_content": cache_name}
+            )
+        except ModelHTTPError as e:
+            # Expired/deleted caches surface as 403/404; drop it so the next call recreates it.
+            if e.status_code not in (403, 404):
+                raise
+            logger.info(
+                "Job parser explicit cache %s gone (%s); falling back to inline prompt",
+                cache_name,
+                e.status_code,
+            )
+            _explicit_cache.pop(model, None)
+    return await get_job_parser_agent().run(text)
+
+
+# Identical job text within the TTL reuses one parse; concurrent identical calls share it.
+_parse_cache: SingleFlightCache[JobPosting] = SingleFlightCache(
+    maxsize=PARSE_CACHE_MAXSIZE, ttl=PARSE_CACHE_TTL_SECONDS
+)
+
+
 async def parse_job_posting(text: str, audit_user_id: str | None = None) -> JobPosting:
     """Parse job posting text into structured data."""
-    from hr_breaker.config import get_settings
+    model = get_settings().gemini_flash_model
+    job = await _parse_cache.get_or_run(
+        cache_key(model, SYSTEM_PROMPT, text),
+        lambda: _parse_job_posting_uncached(text, model, audit_user_id),
+    )
+    # Callers may mutate the result; keep the cached instance pristine.
+    return job.model_copy(deep=True)
+
+
+async def _parse_job_posting_uncached(text: str, model: str, audit_user_id: str | None) -> JobPosting:
     from hr_breaker.services.db import get_pool
-    from hr_breaker.services.usage_audit import log_usage_event, tokens_from_run_result
+    from hr_breaker.services.usage_audit import (
+        cached_tokens_from_run_result,
+        log_usage_event,
+        tokens_from_run_result,
+    )
 
-    agent = get_job_parser_agent()
-    settings = get_settings()
-    model = settings.gemini_flash_model
     try:
-        result = await agent.run(f"Parse this job posting:\n\n{text}")
-        job = result.output
-        job.raw_text = text
+        result = await _run_job_parser(text, model)
+        job = _finalize_job(result.output, text)
         if audit_user_id:
             pool = await get_pool()
             inp, out = tokens_from_run_result(result)
             await log_usage_event(
-                pool, audit_user_id, "job_parse", model, input_tokens=inp, output_tokens=out
+                pool,
+                audit_user_id,
+                "job_parse",
+                model,
+                input_tokens=inp,
+                output_tokens=out,
+                metadata={"cache_read_tokens": cached_tokens_from_run_result(result)},
             )
         return job
     except Exception as e:
@@ -95,3 +239,73 @@ async def parse_job_posting(text: str, audit_user_id: str | None = None) -> JobP
                 error_message=str(e)[:2000],
             )
         raise
+
+
+def _finalize_job(job: JobPosting, text: str) -> JobPosting:
+    job.raw_text = text
+    # Keywords/requirements repeat across postings and optimize iterations; share one str each.
+    job.keywords = [sys.intern(k) for k in job.keywords]
+    job.requirements = [sys.intern(r) for r in job.requirements]
+    return job
+
+
+def _format_batch_prompt(texts: list[str]) -> str:
+    return "\n\n".join(f"Posting {i}:\n{text}" for i, text in enumerate(texts, start=1))
+
+
+async def parse_job_postings_batch(
+    texts: list[str], audit_user_id: str | None = None
+) -> list[JobPosting]:
+    """Parse several job postings in one LLM request; results are in input order.
+
+    Falls back to one parse_job_posting call per text if the model returns the wrong
+    number of postings.
+    """
+    if len(texts) <= 1:
+        return [await parse_job_posting(text, audit_user_id=audit_user_id) for text in texts]
+
+    from hr_breaker.services.db import get_pool
+    from hr_breaker.services.usage_audit import log_usage_event, tokens_from_run_result
+
+    model = get_settings().gemini_flash_model
+    try:
+        result = await get_batch_job_parser_agent().run(_format_batch_prompt(texts))
+    except Exception as e:
+        if audit_user_id:
+            pool = await get_pool()
+            await log_usage_event(
+                pool,
+                audit_user_id,
+                "job_parse",
+                model,
+                success=False,
+                error_message=str(e)[:2000],
+                metadata={"batch_size": len(texts)},
+            )
+        raise
+    if audit_user_id:
+        pool = await get_pool()
+        inp, out = tokens_from_run_result(result)
+        await log_usage_event(
+            pool,
+            audit_user_id,
+            "job_parse",
+            model,
+            input_tokens=inp,
+            output_tokens=out,
+            metadata={"batch_size": len(texts)},
+        )
+
+    jobs = result.output
+    if len(jobs) != len(texts):
+        logger.warning(
+            "Batch job parse returned %d postings for %d inputs; parsing individually",
+            len(jobs),
+            len(texts),
+        )
+        return list(
+            await asyncio.gather(
+                *(parse_job_posting(text, audit_user_id=audit_user_id) for text in texts)
+            )
+        )
+    return [_finalize_job(job, text) for job, text in zip(jobs, texts)]
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic import BaseModel
 from pydantic_ai import Agent
 
@@ -22,6 +24,17 @@ Ignore formatting commands - extract the actual name text only.
 """
 
 
+@lru_cache
+def get_name_extractor_agent(model: str) -> Agent:
+    """One agent per model name, so a GEMINI_FLASH_MODEL change in .env takes effect."""
+    return Agent(
+        gemini_model(model),
+        output_type=ExtractedName,
+        system_prompt=SYSTEM_PROMPT,
+        model_settings=get_model_settings(),
+    )
+
+
 async def extract_name(
     content: str, audit_user_id: str | None = None
 ) -> tuple[str | None, str | None]:
@@ -31,12 +44,7 @@ async def extract_name(
 
     settings = get_settings()
     model = settings.gemini_flash_model
-    agent = Agent(
-        gemini_model(model),
-        output_type=ExtractedName,
-        system_prompt=SYSTEM_PROMPT,
-        model_settings=get_model_settings(),
-    )
+    agent = get_name_extractor_agent(model)
     snippet = content[:settings.agent_name_extractor_chars]
     try:
         result = await agent.run(f"Extract the name from this resume:\n\n{snippet}")
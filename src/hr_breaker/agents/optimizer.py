@@ -1,5 +1,6 @@
 import logging
 from datetime import date
+from functools import lru_cache
 from importlib.resources import files
 
 from pydantic import BaseModel, model_validator
@@ -18,19 +19,16 @@ from hr_breaker.models import (
     ResumeSource,
 )
 from hr_breaker.services.length_estimator import estimate_content_length
-from hr_breaker.services.renderer import HTMLRenderer, RenderError
+from hr_breaker.services.renderer import RenderError, get_renderer
 from hr_breaker.utils import extract_text_from_html
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def _load_resume_guide() -> str:
-    """Load the HTML generation guide for the optimizer (package-safe)."""
-    return (
-        files("hr_breaker.templates")
-        .joinpath("resume_guide.md")
-        .read_text(encoding="utf-8")
-    )
+    """Load the HTML generation guide for the optimizer (package-safe, read once)."""
+    return files("hr_breaker.templates").joinpath("resume_guide.md").read_text(encoding="utf-8")
 
 
 OPTIMIZER_BASE = r"""
@@ -246,7 +244,7 @@ def get_optimizer_agent(
 
         # Actually render PDF to check real page count
         try:
-            renderer = HTMLRenderer()
+            renderer = get_renderer()
             render_result = renderer.render(html)
             page_count = render_result.page_count
             fits_one_page = page_count == 1
@@ -309,7 +307,7 @@ def get_optimizer_agent(
     def preview_resume(html: str) -> BinaryContent:
         """Render HTML to PDF and return preview image. Use to visually check layout."""
         logger.debug("preview_resume called")
-        renderer = HTMLRenderer()
+        renderer = get_renderer()
         result = renderer.render(html)
         image_bytes, _ = pdf_to_image(result.pdf_bytes)
         return BinaryContent(data=image_bytes, media_type="image/png")
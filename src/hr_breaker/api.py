@@ -5,20 +5,20 @@ FastAPI backend for HR-Breaker (React frontend).
 from __future__ import annotations
 
 import asyncio
-import base64
 import hashlib
 import io
 import json
 import logging
 import re
 import secrets
-import tempfile
 import time
+from collections import OrderedDict
 from datetime import date, datetime, timedelta, timezone
 from urllib.parse import quote
 from pathlib import Path
 from typing import Any, Literal
 
+import pybase64
 from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Request, Query, Form
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse, RedirectResponse, Response, StreamingResponse
@@ -43,14 +43,15 @@ from hr_breaker.models import GeneratedPDF, JobPosting, ResumeSource, UnifiedRes
 from hr_breaker.orchestration import optimize_for_job
 from hr_breaker.services import (
     CloudflareBlockedError,
-    HTMLRenderer,
     PDFStorage,
+    get_renderer,
     list_templates,
     render_template_html,
     scrape_job_posting,
     wrap_full_html,
 )
 from hr_breaker.services.job_scraper import extract_company_logo_url
+from hr_breaker.services.single_flight import SingleFlightCache
 from hr_breaker.services.email_automation_registry import (
     AUTOMATION_DEFINITIONS,
     automation_def_by_id,
@@ -176,6 +177,16 @@ def _put_progress(queue: asyncio.Queue | None, percent: int, message: str) -> No
             pass
 
 
+def _discard_task(task: asyncio.Task | None) -> None:
+    """Cancel a side task whose result is no longer needed, without 'exception never retrieved' noise."""
+    if task is None:
+        return
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
 def _put_admin_log(queue: asyncio.Queue | None, user: dict | None, entry: dict[str, Any]) -> None:
     """Stream structured pipeline events to admin clients (SSE); no-op if not admin or no queue."""
     if queue is None or not user or not _is_admin_user(user):
@@ -216,6 +227,99 @@ def _cache_get(key: str) -> Any | None:
 
 def _cache_set(key: str, value: Any) -> None:
     _pipeline_cache[key] = (value, time.monotonic())
+
+
+# Completed /optimize responses (without inline PDF) for repeated runs on the same resume + job.
+# Only results saved to history are kept; a hit re-reads the PDF from storage.
+_OPTIMIZE_CACHE_TTL = 24 * 3600
+_OPTIMIZE_CACHE_MAXSIZE = 64
+_optimize_cache: OrderedDict[str, tuple[OptimizeResponse, float]] = OrderedDict()
+
+
+def _optimize_cache_key(
+    req: OptimizeRequest,
+    *,
+    user_id: str | None,
+    source_checksum: str,
+    job_text: str | None,
+    output_language: str,
+) -> str:
+    payload = json.dumps(
+        {
+            "user_id": user_id,
+            "source_checksum": source_checksum,
+            "job_text": hashlib.sha256((job_text or "").encode()).hexdigest(),
+            # Echoed into the response's pre_* and improvement_*_pp fields
+            "pre_ats_score": req.pre_ats_score,
+            "pre_keyword_score": req.pre_keyword_score,
+            "improve_mode": req.improve_mode,
+            "aggressive_tailoring": req.aggressive_tailoring,
+            "output_language": output_language,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _optimize_cache_get(key: str) -> OptimizeResponse | None:
+    entry = _optimize_cache.get(key)
+    if entry is None:
+        return None
+    value, ts = entry
+    if time.monotonic() - ts > _OPTIMIZE_CACHE_TTL:
+        _optimize_cache.pop(key, None)
+        return None
+    _optimize_cache.move_to_end(key)
+    return value
+
+
+def _optimize_cache_set(key: str, value: OptimizeResponse) -> None:
+    # The snapshot deep link belongs to the run that saved it (and expires); hits return none.
+    stored = value.model_copy(update={"pdf_base64": None, "snapshot_url": None, "snapshot_expires_at": None})
+    _optimize_cache[key] = (stored, time.monotonic())
+    _optimize_cache.move_to_end(key)
+    while len(_optimize_cache) > _OPTIMIZE_CACHE_MAXSIZE:
+        _optimize_cache.popitem(last=False)
+
+
+async def _user_can_export_pdf(user: dict | None) -> bool:
+    """False for signed-in non-admin users without a paid plan (PDF is held for upgrade)."""
+    if user and not _is_admin_user(user):
+        pool = await get_pool()
+        if pool:
+            sub = await user_get_subscription(pool, str(user["id"]))
+            if not _subscription_has_paid(sub):
+                return False
+    return True
+
+
+async def _optimize_cache_hit(
+    key: str, req: OptimizeRequest, user_id: str | None
+) -> OptimizeResponse | None:
+    """Cached response if its PDF is still in the user's history, with base64 re-read on request."""
+    cached = _optimize_cache_get(key)
+    if cached is None or not cached.pdf_filename:
+        return None
+    record = await pdf_storage.get_record_by_filename_async(cached.pdf_filename, user_id=user_id)
+    if record is None or not record.path.is_file():
+        _optimize_cache.pop(key, None)
+        return None
+    if not req.include_pdf_base64:
+        return cached
+    pdf_bytes = await asyncio.to_thread(record.path.read_bytes)
+    return cached.model_copy(update={"pdf_base64": pybase64.b64encode_as_string(pdf_bytes)})
+
+
+# Scraped job text by sanitized URL: preview (/job/parse, /analyze) then /optimize scrapes once.
+# Single-flight, so concurrent clients on the same URL share one scrape; errors are not cached.
+_SCRAPE_CACHE_TTL = 600  # 10 minutes
+_SCRAPE_CACHE_MAXSIZE = 128
+_scrape_cache: SingleFlightCache[str] = SingleFlightCache(maxsize=_SCRAPE_CACHE_MAXSIZE, ttl=_SCRAPE_CACHE_TTL)
+
+
+async def cached_scrape(url: str) -> str:
+    """scrape_job_posting in a worker thread, memoized per URL."""
+    return await _scrape_cache.get_or_run(url, lambda: asyncio.to_thread(scrape_job_posting, url))
 # --------------------------------------------------------------------------
 FREE_OPTIMIZE_PER_MONTH = 10
 PENDING_EXPORT_TTL_SECONDS = 15 * 60
@@ -528,6 +632,8 @@ class OptimizeRequest(BaseModel):
     session_template_id: str | None = Field(None, max_length=200)
     session_photo_data_url: str | None = Field(None, max_length=900_000)
     session_analyze: dict[str, Any] | None = None  # AnalyzeResponse-shaped JSON from client
+    # Inline PDF in the response; default off — clients fetch /history/download/{pdf_filename} instead.
+    include_pdf_base64: bool = False
 
 
 class AnalyzeRequest(BaseModel):
@@ -600,6 +706,14 @@ class JobPostingOut(BaseModel):
     description: str
 
 
+def _job_out(job: JobPosting) -> JobPostingOut:
+    """Public view of a parsed JobPosting (no raw_text).
+
+    The posting is already validated, so build the subset without a second validation pass.
+    """
+    return JobPostingOut.model_construct(**{name: getattr(job, name) for name in JobPostingOut.model_fields})
+
+
 class ChangeDetailOut(BaseModel):
     category: str
     description: str | None = None
@@ -2719,13 +2833,7 @@ async def api_landing_analyze(
         score_resume_vs_job(resume_content, job),
         get_analysis_insights(resume_content, job),
     )
-    job_out = JobPostingOut(
-        title=job.title,
-        company=job.company,
-        requirements=job.requirements,
-        keywords=job.keywords,
-        description=job.description,
-    )
+    job_out = _job_out(job)
     recommendations = _recommendations_from_insights(
         insights,
         ats_score=ats_score,
@@ -2796,27 +2904,17 @@ async def api_extract_resume_summary(req: ExtractResumeSummaryRequest) -> Extrac
 @router.post("/resume/parse-pdf", response_model=ParsePdfResponse)
 async def api_parse_resume_pdf(file: UploadFile = File(...)) -> ParsePdfResponse:
     """Extract text from uploaded PDF resume."""
-    tmp_path: Path | None = None
     try:
         if not file.filename or not file.filename.lower().endswith(".pdf"):
             raise HTTPException(400, "Expected a PDF file")
         body = await file.read()
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            tmp.write(body)
-            tmp_path = Path(tmp.name)
-        content = await asyncio.to_thread(extract_text_from_pdf, tmp_path)
+        content = await asyncio.to_thread(extract_text_from_pdf, body)
         return ParsePdfResponse(content=content)
     except HTTPException:
         raise
     except Exception as e:
         logger.exception("parse-pdf failed: %s", e)
         raise HTTPException(500, detail=f"PDF error: {e!s}")
-    finally:
-        if tmp_path is not None:
-            try:
-                tmp_path.unlink(missing_ok=True)
-            except OSError:
-                pass
 
 
 def _extract_text_from_docx(data: bytes) -> str:
@@ -2832,15 +2930,7 @@ async def _resume_upload_to_text(filename: str | None, data: bytes) -> str:
         raise HTTPException(400, "Empty file")
     name = (filename or "resume.txt").lower()
     if name.endswith(".pdf"):
-        tmp_path: Path | None = None
-        try:
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-                tmp.write(data)
-                tmp_path = Path(tmp.name)
-            return await asyncio.to_thread(extract_text_from_pdf, tmp_path)
-        finally:
-            if tmp_path is not None:
-                tmp_path.unlink(missing_ok=True)
+        return await asyncio.to_thread(extract_text_from_pdf, data)
     if name.endswith(".docx"):
         return await asyncio.to_thread(_extract_text_from_docx, data)
     if name.endswith((".txt", ".md", ".tex", ".html", ".htm")):
@@ -3017,7 +3107,7 @@ async def api_parse_job(req: JobParseRequest) -> JobPostingOut:
                 "This is a job search page link. Use a link to a single job posting (e.g. indeed.com/viewjob?jk=...).",
             )
         try:
-            job_text = await asyncio.to_thread(scrape_job_posting, url)
+            job_text = await cached_scrape(url)
         except CloudflareBlockedError:
             raise HTTPException(422, "Job URL blocked by bot protection. Paste text instead.")
         except Exception as e:
@@ -3035,13 +3125,7 @@ async def api_parse_job(req: JobParseRequest) -> JobPostingOut:
             raise HTTPException(401, _API_KEY_INVALID_MSG)
         raise HTTPException(500, f"Job parse failed: {e!s}")
 
-    return JobPostingOut(
-        title=job.title,
-        company=job.company,
-        requirements=job.requirements,
-        keywords=job.keywords,
-        description=job.description,
-    )
+    return _job_out(job)
 
 
 # Шум из TF-IDF: обрезки типа m/w/d, однобуквенные, слишком короткие
@@ -3480,7 +3564,7 @@ async def api_analyze(req: AnalyzeRequest, user: dict | None = Depends(get_optio
 
             host = urlparse(url).netloc or url[:64]
             alog("scrape", "Fetching job URL", {"host": host})
-            job_text = await asyncio.to_thread(scrape_job_posting, url)
+            job_text = await cached_scrape(url)
             alog("scrape", "Job page scraped to plain text", {"job_text_chars": len(job_text)})
         except CloudflareBlockedError:
             pool = await get_pool()
@@ -3529,13 +3613,7 @@ async def api_analyze(req: AnalyzeRequest, user: dict | None = Depends(get_optio
     )
 
     resume_stripped = req.resume_content.strip()
-    job_out = JobPostingOut(
-        title=job.title,
-        company=job.company,
-        requirements=job.requirements,
-        keywords=job.keywords,
-        description=job.description,
-    )
+    job_out = _job_out(job)
     tpl_draft = (req.session_template_id or "").strip()[:200] or ""
     if user_id and user_id != "local":
         pool_d1 = await get_pool()
@@ -3703,6 +3781,7 @@ async def _run_optimize(
         },
     )
     job_text = req.job_text
+    scrape_url: str | None = None
     if not req.improve_mode:
         if req.job_url and not job_text:
             url = _sanitize_url(req.job_url)
@@ -3713,9 +3792,75 @@ async def _run_optimize(
                     job=JobPostingOut(title="", company="", requirements=[], keywords=[], description=""),
                     error="This is a job search page link. Use a link to a single job posting (e.g. indeed.com/viewjob?jk=...).",
                 )
+            scrape_url = url
+        elif not job_text:
+            raise HTTPException(400, "Provide job_text or job_url")
+
+    source = ResumeSource(content=req.resume_content)
+    # Same digest as _cache_key("name:", content); reuses the checksum hashed once on source.
+    _name_cache_key = "name:" + source.checksum
+    _cached_name = _cache_get(_name_cache_key)
+    out_lang = (req.output_language or "en").strip().lower() or "en"
+    # Checked once per run: gates both the completion cache and saving the PDF to history.
+    can_export_pdf = await _user_can_export_pdf(user)
+
+    def _completion_cache_key() -> str:
+        return _optimize_cache_key(
+            req,
+            user_id=user_id,
+            source_checksum=source.checksum,
+            job_text=job_text if not req.improve_mode else None,
+            output_language=out_lang,
+        )
+
+    async def _completion_cache_lookup() -> OptimizeResponse | None:
+        """Saved result for the same resume + job; never served to users who cannot export the PDF."""
+        if not can_export_pdf:
+            return None
+        cached = await _optimize_cache_hit(_completion_cache_key(), req, user_id)
+        if cached is not None:
+            logger.info("Optimize served from completion cache: %s", cached.pdf_filename)
+            _put_admin_log(
+                progress_queue,
+                user,
+                {
+                    "step": "completion_cache",
+                    "message": "Same resume + job already optimized; returning saved result",
+                    "data": {"pdf_filename": cached.pdf_filename},
+                },
+            )
+            _put_progress(progress_queue, 100, "Done")
+            pool = await get_pool()
+            await log_usage_event(
+                pool,
+                audit_uid,
+                "optimize_complete",
+                None,
+                success=True,
+                metadata={
+                    "validation_passed": cached.validation.passed,
+                    "has_pdf": True,
+                    "completion_cache": True,
+                },
+            )
+        return cached
+
+    if scrape_url is None:
+        # Job text is already known: check before starting any LLM call.
+        cached_response = await _completion_cache_lookup()
+        if cached_response is not None:
+            return cached_response
+
+    # Name extraction (LLM) is independent of the job: start it now so it overlaps the scrape.
+    name_task: asyncio.Task[tuple[str | None, str | None]] | None = None
+    try:
+        if _cached_name is None:
+            name_task = asyncio.create_task(extract_name(req.resume_content, audit_user_id=audit_uid))
+
+        if scrape_url is not None:
             _put_progress(progress_queue, 2, "Loading job from URL…")
             try:
-                job_text = await asyncio.to_thread(scrape_job_posting, url)
+                job_text = await cached_scrape(scrape_url)
                 _put_progress(progress_queue, 5, "Job loaded")
                 _put_admin_log(
                     progress_queue,
@@ -3723,6 +3868,7 @@ async def _run_optimize(
                     {"step": "scrape", "message": "Job URL scraped to text", "data": {"job_text_chars": len(job_text)}},
                 )
             except CloudflareBlockedError:
+                _discard_task(name_task)
                 pool = await get_pool()
                 await log_usage_event(
                     pool, audit_uid, "optimize_job_scrape", None, success=False, error_message="Cloudflare blocked"
@@ -3734,6 +3880,7 @@ async def _run_optimize(
                     error="Job URL blocked by bot protection. Paste job text instead.",
                 )
             except Exception as e:
+                _discard_task(name_task)
                 pool = await get_pool()
                 await log_usage_event(
                     pool, audit_uid, "optimize_job_scrape", None, success=False, error_message=str(e)[:2000]
@@ -3744,55 +3891,62 @@ async def _run_optimize(
                     job=JobPostingOut(title="", company="", requirements=[], keywords=[], description=""),
                     error=str(e),
                 )
-        if not job_text:
-            raise HTTPException(400, "Provide job_text or job_url")
+            if not job_text:
+                raise HTTPException(400, "Provide job_text or job_url")
 
-    _put_admin_log(
-        progress_queue,
-        user,
-        {
-            "step": "job_text",
-            "message": "Job description text ready for pipeline" if not req.improve_mode else "Improve mode — no job text",
-            "data": {"chars": len(job_text or ""), "improve_mode": req.improve_mode, "from_scrape": bool(req.job_url and req.job_text is None)},
-        },
-    )
+        _put_admin_log(
+            progress_queue,
+            user,
+            {
+                "step": "job_text",
+                "message": "Job description text ready for pipeline" if not req.improve_mode else "Improve mode — no job text",
+                "data": {"chars": len(job_text or ""), "improve_mode": req.improve_mode, "from_scrape": bool(req.job_url and req.job_text is None)},
+            },
+        )
 
-    source = ResumeSource(content=req.resume_content)
-    _put_progress(progress_queue, 7, "Extracting name from resume…")
-    _name_cache_key = _cache_key("name:", req.resume_content)
-    _cached_name = _cache_get(_name_cache_key)
-    if _cached_name is not None:
-        source.first_name, source.last_name = _cached_name
-        _put_progress(progress_queue, 10, "Name extracted")
-    else:
-        try:
-            first_name, last_name = await extract_name(req.resume_content, audit_user_id=audit_uid)
-            source.first_name = first_name
-            source.last_name = last_name
-            _cache_set(_name_cache_key, (first_name, last_name))
+        if scrape_url is not None:
+            cached_response = await _completion_cache_lookup()
+            if cached_response is not None:
+                _discard_task(name_task)
+                return cached_response
+
+        _put_progress(progress_queue, 7, "Extracting name from resume…")
+        if name_task is None:
+            source.first_name, source.last_name = _cached_name
             _put_progress(progress_queue, 10, "Name extracted")
-            _put_admin_log(
-                progress_queue,
-                user,
-                {
-                    "step": "name",
-                    "message": "Name extracted from resume (LLM)",
-                    "data": {"first_name": source.first_name, "last_name": source.last_name},
-                },
-            )
-        except Exception as e:
-            logger.exception("Optimize failed")
-            err_msg = _API_KEY_INVALID_MSG if _is_api_key_invalid(e) else str(e)
-            pool = await get_pool()
-            await log_usage_event(
-                pool, audit_uid, "optimize_extract_name", None, success=False, error_message=err_msg[:2000]
-            )
-            return OptimizeResponse(
-                success=False,
-                validation=ValidationResultOut(passed=False, results=[]),
-                job=JobPostingOut(title="", company="", requirements=[], keywords=[], description=""),
-                error=err_msg,
-            )
+        else:
+            try:
+                first_name, last_name = await name_task
+                source.first_name = first_name
+                source.last_name = last_name
+                _cache_set(_name_cache_key, (first_name, last_name))
+                _put_progress(progress_queue, 10, "Name extracted")
+                _put_admin_log(
+                    progress_queue,
+                    user,
+                    {
+                        "step": "name",
+                        "message": "Name extracted from resume (LLM)",
+                        "data": {"first_name": source.first_name, "last_name": source.last_name},
+                    },
+                )
+            except Exception as e:
+                logger.exception("Optimize failed")
+                err_msg = _API_KEY_INVALID_MSG if _is_api_key_invalid(e) else str(e)
+                pool = await get_pool()
+                await log_usage_event(
+                    pool, audit_uid, "optimize_extract_name", None, success=False, error_message=err_msg[:2000]
+                )
+                return OptimizeResponse(
+                    success=False,
+                    validation=ValidationResultOut(passed=False, results=[]),
+                    job=JobPostingOut(title="", company="", requirements=[], keywords=[], description=""),
+                    error=err_msg,
+                )
+    except BaseException:
+        # Any exit not handled above (cancellation, a failing lookup) must not orphan the task.
+        _discard_task(name_task)
+        raise
     extracted_full_name = _compose_person_name(source.first_name, source.last_name)
     if not extracted_full_name:
         guessed_full_name = _guess_name_from_resume_text(extract_text_from_html(req.resume_content))
@@ -3808,7 +3962,6 @@ async def _run_optimize(
     def push_admin_log(entry: dict[str, Any]) -> None:
         _put_admin_log(progress_queue, user, entry)
 
-    out_lang = (req.output_language or "en").strip().lower() or "en"
     _job_cache_key = _cache_key("job:", job_text or "__improve_mode__") if not req.improve_mode else None
     _cached_job = _cache_get(_job_cache_key) if _job_cache_key else None
     try:
@@ -3860,13 +4013,7 @@ async def _run_optimize(
             for r in validation.results
         ],
     )
-    job_out = JobPostingOut(
-        title=job.title,
-        company=job.company,
-        requirements=job.requirements,
-        keywords=job.keywords,
-        description=job.description,
-    )
+    job_out = _job_out(job)
     key_changes_out = None
     if optimized and optimized.changes:
         key_changes_out = [
@@ -3916,13 +4063,6 @@ async def _run_optimize(
     snapshot_url_out: str | None = None
     snapshot_expires_at_out: str | None = None
     _put_progress(progress_queue, 85, "Saving PDF…")
-    can_export_pdf = True
-    if user and not _is_admin_user(user):
-        pool_for_sub = await get_pool()
-        if pool_for_sub:
-            sub = await user_get_subscription(pool_for_sub, str(user["id"]))
-            if not _subscription_has_paid(sub):
-                can_export_pdf = False
 
     async def _extract_schema_json_for_templates() -> str | None:
         """Second LLM pass for template JSON; runs in parallel with PDF save / post-ATS to shorten wall time."""
@@ -4013,7 +4153,8 @@ async def _run_optimize(
             source_was_pdf=req.source_was_pdf,
         ), user_id=user_id)
         pdf_filename = pdf_path.name
-        pdf_b64 = base64.b64encode(optimized.pdf_bytes).decode()
+        if req.include_pdf_base64:
+            pdf_b64 = pybase64.b64encode_as_string(optimized.pdf_bytes)
     elif optimized and optimized.pdf_bytes and not can_export_pdf:
         txt = (optimized.pdf_text or "").strip()
         if txt:
@@ -4172,7 +4313,7 @@ async def _run_optimize(
         except Exception as e:
             logger.warning("Win-back schedule skipped: %s", e)
 
-    return OptimizeResponse(
+    response = OptimizeResponse(
         success=ok,
         pdf_base64=pdf_b64,
         pdf_filename=pdf_filename,
@@ -4193,6 +4334,9 @@ async def _run_optimize(
             post_kw=post_kw,
         ),
     )
+    if ok and pdf_filename:
+        _optimize_cache_set(_completion_cache_key(), response)
+    return response
 
 
 @router.post("/optimize", response_model=OptimizeResponse)
@@ -4228,8 +4372,10 @@ async def api_optimize_stream(req: OptimizeRequest, user: dict | None = Depends(
                     yield f"data: {json.dumps({'log': log_entry}, ensure_ascii=False)}\n\n"
                 elif item[0] == "done":
                     _, result = item
-                    payload = {"percent": 100, "message": "Done", "result": result.model_dump(mode="json")}
-                    yield f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+                    # The result can carry a large base64 PDF: serialize it with pydantic-core in one
+                    # pass instead of model_dump() -> dict -> json.dumps().
+                    result_json = result.model_dump_json()
+                    yield f'data: {{"percent": 100, "message": "Done", "result": {result_json}}}\n\n'
                     break
                 elif item[0] == "error":
                     _, err = item
@@ -4435,9 +4581,9 @@ async def api_templates_render_pdf(
         html_body = render_template_html(req.resume_schema, req.template_id)
     except ValueError as e:
         raise HTTPException(400, str(e)) from e
-    renderer = HTMLRenderer()
-    result = renderer.render(html_body)
-    pdf_b64 = base64.b64encode(result.pdf_bytes).decode("utf-8")
+    renderer = get_renderer()
+    result = await renderer.render_async(html_body)
+    pdf_b64 = pybase64.b64encode_as_string(result.pdf_bytes)
     return AdminTemplateRenderPdfResponse(
         pdf_base64=pdf_b64,
         page_count=result.page_count,
@@ -4487,9 +4633,9 @@ async def api_admin_templates_render_pdf(
         html_body = render_template_html(req.resume_schema, req.template_id)
     except ValueError as e:
         raise HTTPException(400, str(e)) from e
-    renderer = HTMLRenderer()
-    result = renderer.render(html_body)
-    pdf_b64 = base64.b64encode(result.pdf_bytes).decode("utf-8")
+    renderer = get_renderer()
+    result = await renderer.render_async(html_body)
+    pdf_b64 = pybase64.b64encode_as_string(result.pdf_bytes)
     return AdminTemplateRenderPdfResponse(
         pdf_base64=pdf_b64,
         page_count=result.page_count,
@@ -6471,6 +6617,22 @@ async def startup_deferred_seed() -> None:
     asyncio.create_task(_startup_seed_and_backfill())
 
 
+@app.on_event("startup")
+async def startup_warm_agents() -> None:
+    """Build the first-hop LLM agents up front so the first /optimize does not pay provider/client init."""
+    settings = get_settings()
+    if not settings.google_api_key:
+        return
+    from hr_breaker.agents.job_parser import get_job_parser_agent
+    from hr_breaker.agents.name_extractor import get_name_extractor_agent
+
+    try:
+        get_job_parser_agent()
+        get_name_extractor_agent(settings.gemini_flash_model)
+    except Exception as e:
+        logger.warning("Agent warm-up skipped: %s", e)
+
+
 app.include_router(router)
 
 
@@ -6496,11 +6658,18 @@ if _frontend_dist.is_dir():
 
 
 def run_api(host: str = "0.0.0.0", port: int = 8000, reload: bool = False) -> None:
+    import importlib.util
+
     import uvicorn
+
+    # uvloop is not installed on Windows / PyPy, where an explicit loop="uvloop" crashes startup.
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "auto"
     uvicorn.run(
         "hr_breaker.api:app",
         host=host,
         port=port,
         reload=reload,
         reload_dirs=["src"] if reload else None,
+        loop=loop,
+        http="httptools",
     )
@@ -39,6 +39,10 @@ class Settings(BaseModel):
     gemini_pro_model: str = "gemini-3-pro-preview"
     gemini_flash_model: str = "gemini-3-flash-preview"
     gemini_thinking_budget: int | None = 8192
+    # Explicit Gemini context cache for static system prompts (job parser). Off by default:
+    # Gemini rejects caches below the model's minimum token count (1024–4096 depending on model).
+    gemini_explicit_cache: bool = False
+    gemini_explicit_cache_ttl_seconds: int = 3600
     cache_dir: Path = Path(".cache/resumes")
     output_dir: Path = Path("output")
     max_iterations: int = 1
@@ -156,6 +160,8 @@ def get_settings() -> Settings:
         gemini_pro_model=os.getenv("GEMINI_PRO_MODEL") or "gemini-3-pro-preview",
         gemini_flash_model=os.getenv("GEMINI_FLASH_MODEL") or "gemini-3-flash-preview",
         gemini_thinking_budget=thinking_budget,
+        gemini_explicit_cache=os.getenv("GEMINI_EXPLICIT_CACHE", "false").lower() in ("true", "1", "yes"),
+        gemini_explicit_cache_ttl_seconds=int(os.getenv("GEMINI_EXPLICIT_CACHE_TTL_SECONDS", "3600")),
         fast_mode=os.getenv("HR_BREAKER_FAST_MODE", "true").lower() in ("true", "1", "yes"),
         # Product policy: always single-pass optimization.
         max_iterations=1,
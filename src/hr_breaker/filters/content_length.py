@@ -55,7 +55,7 @@ class ContentLengthChecker(BaseFilter):
 
         try:
             renderer = get_renderer()
-            render_result = renderer.render(optimized.html)
+            render_result = await renderer.render_async(optimized.html)
             page_count = render_result.page_count
             pdf_bytes = render_result.pdf_bytes
         except RenderError as e:
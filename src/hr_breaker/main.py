@@ -1,9 +1,7 @@
 import asyncio
 import subprocess
 import sys
-import tempfile
 from datetime import datetime
-from pathlib import Path
 
 import nest_asyncio
 import streamlit as st
@@ -175,15 +173,7 @@ with col_resume:
             )
             if uploaded_file:
                 if uploaded_file.name.lower().endswith(".pdf"):
-                    with tempfile.NamedTemporaryFile(
-                        suffix=".pdf", delete=False
-                    ) as tmp:
-                        tmp.write(uploaded_file.read())
-                        temp_path = Path(tmp.name)
-                    try:
-                        resume_content = extract_text_from_pdf(temp_path)
-                    finally:
-                        temp_path.unlink(missing_ok=True)
+                    resume_content = extract_text_from_pdf(uploaded_file.read())
                 else:
                     resume_content = uploaded_file.read().decode("utf-8")
         else:
@@ -3,7 +3,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field, computed_field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, model_validator
 
 from hr_breaker.models.resume_data import ResumeData
 
@@ -24,6 +24,9 @@ class ResumeSource(BaseModel):
     first_name: str | None = None
     last_name: str | None = None
 
+    # (content, sha256) of the content last hashed; any input "checksum" key is ignored.
+    _checksum_cache: tuple[str, str] | None = PrivateAttr(default=None)
+
     @model_validator(mode="before")
     @classmethod
     def handle_legacy_latex_field(cls, data: Any) -> Any:
@@ -40,7 +43,13 @@ class ResumeSource(BaseModel):
     @computed_field
     @property
     def checksum(self) -> str:
-        return hashlib.sha256(self.content.encode()).hexdigest()
+        # Hashed once per content object: the optimize pipeline reads it many times per run.
+        # The identity check also covers assignment and model_copy(update={"content": ...}).
+        cached = self._checksum_cache
+        if cached is None or cached[0] is not self.content:
+            cached = (self.content, hashlib.sha256(self.content.encode()).hexdigest())
+            self._checksum_cache = cached
+        return cached[1]
 
 
 class OptimizedResume(BaseModel):
@@ -1,12 +1,10 @@
 """Core optimization loop - used by both CLI and Streamlit."""
 
 import asyncio
-import tempfile
 import time
 from collections.abc import Callable
 from typing import Any
 from contextlib import contextmanager
-from pathlib import Path
 
 from hr_breaker.agents import optimize_resume, parse_job_posting
 from hr_breaker.config import get_settings, logger
@@ -27,7 +25,7 @@ from hr_breaker.models import (
     ValidationResult,
 )
 from hr_breaker.services.pdf_parser import extract_text_from_pdf
-from hr_breaker.services.renderer import RenderError, HTMLRenderer
+from hr_breaker.services.renderer import RenderError, get_renderer
 
 # Ensure filters are registered
 _ = DataValidator, LLMChecker, KeywordMatcher, VectorSimilarityMatcher, HallucinationChecker
@@ -177,7 +175,7 @@ async def optimize_for_job(
             entry["data"] = data
         on_admin_log(entry)
 
-    renderer = HTMLRenderer()
+    renderer = get_renderer()
 
     if improve_mode and job is None:
         job = IMPROVE_MODE_JOB
@@ -281,7 +279,7 @@ async def optimize_for_job(
             {"has_html": optimized.html is not None, "has_data": optimized.data is not None},
         )
         # Render PDF and extract text for filters (like real ATS)
-        optimized = _render_and_extract(optimized, renderer)
+        optimized = await _render_and_extract(optimized, renderer)
         if on_progress:
             on_progress(_progress_percent_iteration(i, max_iterations, "render"), "PDF ready")
             on_progress(
@@ -337,28 +335,24 @@ async def optimize_for_job(
     return optimized, validation, job
 
 
-def _render_and_extract(optimized: OptimizedResume, renderer) -> OptimizedResume:
-    """Render PDF and extract text, updating the OptimizedResume."""
+async def _render_and_extract(optimized: OptimizedResume, renderer) -> OptimizedResume:
+    """Render PDF and extract text, updating the OptimizedResume.
+
+    Both steps are CPU-bound and run in worker threads so the event loop stays free.
+    """
     try:
         with log_time("render_pdf"):
             # Use html if available, otherwise fall back to data (legacy)
             if optimized.html is not None:
-                result = renderer.render(optimized.html)
+                result = await renderer.render_async(optimized.html)
             elif optimized.data is not None:
-                result = renderer.render_data(optimized.data)
+                result = await renderer.render_data_async(optimized.data)
             else:
                 raise RenderError("No content to render (neither html nor data)")
 
-        # Extract text from rendered PDF
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(result.pdf_bytes)
-            pdf_path = Path(f.name)
-
-        try:
-            with log_time("extract_text_from_pdf"):
-                pdf_text = extract_text_from_pdf(pdf_path)
-        finally:
-            pdf_path.unlink()
+        # Extract text from rendered PDF (in memory, no temp file)
+        with log_time("extract_text_from_pdf"):
+            pdf_text = await asyncio.to_thread(extract_text_from_pdf, result.pdf_bytes)
 
         return optimized.model_copy(
             update={"pdf_text": pdf_text, "pdf_bytes": result.pdf_bytes}
@@ -2,32 +2,25 @@
 
 from pathlib import Path
 
-import fitz  # pymupdf
+import pymupdf
 
 
 def extract_text_from_pdf_bytes(pdf_bytes: bytes) -> str:
     """Extract text from PDF bytes (e.g. in-memory generated PDF)."""
-    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-    try:
-        return "\n".join(page.get_text() for page in doc)
-    finally:
-        doc.close()
+    with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+        return "\n".join(page.get_text("text") for page in doc)
 
 
-def extract_text_from_pdf(pdf_path: Path) -> str:
-    """Extract text from PDF file.
+def extract_text_from_pdf(pdf: Path | bytes) -> str:
+    """Extract text from a PDF file or in-memory PDF bytes.
 
     Args:
-        pdf_path: Path to PDF file
+        pdf: Path to PDF file, or the PDF bytes themselves (no temp file needed)
 
     Returns:
         Extracted text content
     """
-    doc = fitz.open(pdf_path)
-    text_parts = []
-
-    for page in doc:
-        text_parts.append(page.get_text())
-
-    doc.close()
-    return "\n".join(text_parts)
+    if isinstance(pdf, (bytes, bytearray, memoryview)):
+        return extract_text_from_pdf_bytes(bytes(pdf))
+    with pymupdf.open(pdf) as doc:
+        return "\n".join(page.get_text("text") for page in doc)
@@ -3,15 +3,27 @@ Abstract renderer interface and HTML renderer implementation.
 Production-safe version using importlib.resources.
 """
 
+import asyncio
 import os
 import sys
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
 
 from importlib.resources import files
 from jinja2 import Environment, PackageLoader, select_autoescape
 
 from hr_breaker.models.resume_data import ResumeData, RenderResult
 
+# Package templates directory, resolved once at import.
+_TEMPLATES = files("hr_breaker.templates")
+
 
 # =========================
 # macOS WeasyPrint helpers
@@ -36,6 +48,113 @@ def _setup_macos_library_path():
             return
 
 
+# =========================
+# Cached URL fetcher
+# =========================
+
+# Package template files WeasyPrint fetches while rendering (fonts, images, stylesheets) are
+# identical for every render, so their bytes are kept per process. Anything else — remote
+# http(s) resources such as client-supplied photo URLs, files outside the templates package,
+# data: URLs — is fetched normally on each render. Renders can run in threads, hence the lock.
+_TEMPLATES_DIR = Path(str(_TEMPLATES)).resolve()
+_FETCH_CACHE_MAXSIZE = 64
+_fetch_cache: OrderedDict[str, dict] = OrderedDict()
+_fetch_cache_lock = threading.Lock()
+
+
+def _is_cacheable_url(url: str) -> bool:
+    """Only file: URLs inside the hr_breaker.templates package are cached."""
+    if not url.startswith("file:"):
+        return False
+    path = Path(url2pathname(urlsplit(url).path)).resolve()
+    return path.is_relative_to(_TEMPLATES_DIR)
+
+
+def _fetch_cache_get(url: str) -> dict | None:
+    with _fetch_cache_lock:
+        entry = _fetch_cache.get(url)
+        if entry is not None:
+            _fetch_cache.move_to_end(url)
+        return entry
+
+
+def _fetch_cache_set(url: str, entry: dict) -> None:
+    with _fetch_cache_lock:
+        _fetch_cache[url] = entry
+        _fetch_cache.move_to_end(url)
+        while len(_fetch_cache) > _FETCH_CACHE_MAXSIZE:
+            _fetch_cache.popitem(last=False)
+
+
+def _fetch_through_cache(url: str, fetch: Callable[[str], dict]) -> dict:
+    """fetch(url) for a cacheable URL, memoized; fetch must return plain data (no open files)."""
+    entry = _fetch_cache_get(url)
+    if entry is None:
+        entry = fetch(url)
+        _fetch_cache_set(url, entry)
+    return entry
+
+
+def _cached_url_fetcher(url: str) -> dict:
+    """Function-style url_fetcher (older WeasyPrint): default_url_fetcher, cached."""
+    from weasyprint import default_url_fetcher
+
+    if not _is_cacheable_url(url):
+        return default_url_fetcher(url)
+
+    def fetch(url: str) -> dict:
+        result = default_url_fetcher(url)
+        file_obj = result.pop("file_obj", None)
+        if file_obj is not None:
+            try:
+                result["string"] = file_obj.read()
+            finally:
+                file_obj.close()
+        return result
+
+    return dict(_fetch_through_cache(url, fetch))
+
+
+@lru_cache(maxsize=1)
+def _cached_url_fetcher_class():
+    """URLFetcher subclass (newer WeasyPrint) backed by the same cache, or None."""
+    try:
+        from weasyprint.urls import URLFetcher, URLFetcherResponse
+    except ImportError:
+        return None
+
+    class CachedURLFetcher(URLFetcher):
+        def fetch(self, url, headers=None):
+            if not _is_cacheable_url(url):
+                return super().fetch(url, headers)
+
+            def fetch(url: str) -> dict:
+                response = URLFetcher.fetch(self, url, headers)
+                try:
+                    body = response.read()
+                finally:
+                    response.close()
+                return {
+                    "url": response.url,
+                    "body": body,
+                    "headers": dict(response.headers.items()),
+                    "status": response.status,
+                }
+
+            cached = _fetch_through_cache(url, fetch)
+            return URLFetcherResponse(
+                cached["url"], cached["body"], dict(cached["headers"]), cached["status"]
+            )
+
+    return CachedURLFetcher
+
+
+def _new_url_fetcher():
+    """url_fetcher for one render (fetcher instances keep per-request state)."""
+    fetcher_class = _cached_url_fetcher_class()
+    return fetcher_class() if fetcher_class is not None else _cached_url_fetcher
+
+
 # =========================
 # Errors
 # =========================
@@ -66,6 +185,14 @@ class HTMLRenderer(BaseRenderer):
     """Render resume using HTML + WeasyPrint."""
 
     _weasyprint_imported = False
+    # FontConfiguration enumerates system fonts on construction; one per process is enough.
+    _shared_font_config = None
+    # The shared FontConfiguration (one Pango font map plus mutable caches) is not thread-safe:
+    # WeasyPrint work runs one render at a time. Async callers queue on a dedicated single
+    # thread rather than parking default-executor workers (scraping, text extraction) on the
+    # lock; the lock serializes them against sync callers such as the optimizer's tools.
+    _render_lock = threading.Lock()
+    _render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="weasyprint")
 
     def __init__(self):
         self._ensure_weasyprint()
@@ -76,18 +203,30 @@ class HTMLRenderer(BaseRenderer):
             autoescape=select_autoescape(["html", "xml"]),
         )
 
+        from weasyprint import CSS
         from weasyprint.text.fonts import FontConfiguration
-        self.font_config = FontConfiguration()
+        with HTMLRenderer._render_lock:
+            if HTMLRenderer._shared_font_config is None:
+                HTMLRenderer._shared_font_config = FontConfiguration()
+        self.font_config = HTMLRenderer._shared_font_config
 
         # Load wrapper HTML via importlib.resources
-        self._wrapper_html = (
-            files("hr_breaker.templates")
-            .joinpath("resume_wrapper.html")
-            .read_text(encoding="utf-8")
-        )
+        self._wrapper_html = _TEMPLATES.joinpath("resume_wrapper.html").read_text(encoding="utf-8")
+        # Split once around the body slot; render() just concatenates.
+        self._wrapper_head, _, self._wrapper_tail = self._wrapper_html.partition("{{BODY}}")
+
+        # Legacy Jinja template and its optional stylesheet, parsed once per renderer
+        self._resume_template = self.env.get_template("resume.html")
+        css_path = _TEMPLATES.joinpath("resume.css")
+        with HTMLRenderer._render_lock:
+            self._resume_stylesheets = (
+                [CSS(filename=str(css_path), font_config=self.font_config)]
+                if css_path.is_file()
+                else []
+            )
 
         # Base directory for WeasyPrint (real filesystem path)
-        self._template_base = str(files("hr_breaker.templates"))
+        self._template_base = str(_TEMPLATES)
 
     # -------------------------
     # Lazy WeasyPrint import
@@ -140,15 +279,16 @@ class HTMLRenderer(BaseRenderer):
         """
         from weasyprint import HTML
 
-        html_content = self._wrapper_html.replace("{{BODY}}", html_body)
+        html_content = f"{self._wrapper_head}{html_body}{self._wrapper_tail}"
 
-        html = HTML(
-            string=html_content,
-            base_url=self._template_base,
-        )
-
-        doc = html.render(font_config=self.font_config)
-        pdf_bytes = doc.write_pdf()
+        with self._render_lock:
+            html = HTML(
+                string=html_content,
+                base_url=self._template_base,
+                url_fetcher=_new_url_fetcher(),
+            )
+            doc = html.render(font_config=self.font_config)
+            pdf_bytes = doc.write_pdf()
         page_count = len(doc.pages)
 
         warnings = []
@@ -161,38 +301,32 @@ class HTMLRenderer(BaseRenderer):
             warnings=warnings,
         )
 
+    async def render_async(self, html_body: str) -> RenderResult:
+        """Async variant of render(); runs on the render thread, off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._render_executor, self.render, html_body)
+
     # -------------------------
     # Legacy Jinja rendering
     # -------------------------
 
     def render_data(self, data: ResumeData) -> RenderResult:
         """Render ResumeData to PDF via Jinja template."""
-        from weasyprint import HTML, CSS
-
-        template = self.env.get_template("resume.html")
-        html_content = template.render(resume=data)
+        from weasyprint import HTML
 
-        html = HTML(
-            string=html_content,
-            base_url=self._template_base,
-        )
+        html_content = self._resume_template.render(resume=data)
 
-        stylesheets = []
-        css_path = files("hr_breaker.templates").joinpath("resume.css")
-        if css_path.exists():
-            stylesheets.append(
-                CSS(
-                    filename=str(css_path),
-                    font_config=self.font_config,
-                )
+        with self._render_lock:
+            html = HTML(
+                string=html_content,
+                base_url=self._template_base,
+                url_fetcher=_new_url_fetcher(),
             )
-
-        doc = html.render(
-            stylesheets=stylesheets,
-            font_config=self.font_config,
-        )
-
-        pdf_bytes = doc.write_pdf()
+            doc = html.render(
+                stylesheets=self._resume_stylesheets,
+                font_config=self.font_config,
+            )
+            pdf_bytes = doc.write_pdf()
         page_count = len(doc.pages)
 
         warnings = []
@@ -205,11 +339,17 @@ class HTMLRenderer(BaseRenderer):
             warnings=warnings,
         )
 
+    async def render_data_async(self, data: ResumeData) -> RenderResult:
+        """Async variant of render_data(); runs on the render thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._render_executor, self.render_data, data)
+
 
 # =========================
 # Factory
 # =========================
 
+@lru_cache
 def get_renderer() -> HTMLRenderer:
-    """Get the HTML renderer."""
+    """Get the shared HTML renderer (wrapper, Jinja template and fonts are loaded once)."""
     return HTMLRenderer()
@@ -0,0 +1,71 @@
+"""Single-flight LRU + TTL cache for async results (LLM parses, scraped pages).
+
+Concurrent callers for the same key await one factory call; repeated keys within the TTL
+reuse its result. Failures are never cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAXSIZE = 256
+DEFAULT_TTL_SECONDS = 3600.0
+
+
+class SingleFlightCache(Generic[T]):
+    """LRU + TTL cache of asyncio tasks; failures are never cached.
+
+    The factory runs as its own task and every caller awaits it through asyncio.shield, so
+    cancelling one caller (e.g. a disconnected stream client) never cancels the others.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float = DEFAULT_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[asyncio.Future[T], float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _lookup(self, key: str) -> asyncio.Future[T] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        fut, created_at = entry
+        usable = time.monotonic() - created_at <= self.ttl and not (
+            fut.done() and (fut.cancelled() or fut.exception() is not None)
+        )
+        # In-flight tasks are bound to their loop (Streamlit and the API run separate loops).
+        if usable and not fut.done() and fut.get_loop() is not asyncio.get_running_loop():
+            usable = False
+        if not usable:
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return fut
+
+    def _forget_failed(self, key: str, task: asyncio.Future[T]) -> None:
+        # exception() also marks the error retrieved: no "never retrieved" warning without waiters
+        if task.cancelled() or task.exception() is not None:
+            if self._entries.get(key, (None,))[0] is task:
+                self._entries.pop(key, None)
+
+    async def get_or_run(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value for key, awaiting an in-flight call or starting a new one."""
+        task = self._lookup(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            task.add_done_callback(lambda t: self._forget_failed(key, t))
+            self._entries[key] = (task, time.monotonic())
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return await asyncio.shield(task)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from html import escape
 from importlib.resources import files
 
@@ -1185,10 +1186,10 @@ def render_template_html(schema: UnifiedResumeSchema, template_id: str) -> str:
     return renderer(schema, accent)
 
 
+@lru_cache(maxsize=1)
+def _wrapper_html() -> str:
+    return files("hr_breaker.templates").joinpath("resume_wrapper.html").read_text(encoding="utf-8")
+
+
 def wrap_full_html(html_body: str) -> str:
-    wrapper = (
-        files("hr_breaker.templates")
-        .joinpath("resume_wrapper.html")
-        .read_text(encoding="utf-8")
-    )
-    return wrapper.replace("{{BODY}}", html_body)
+    return _wrapper_html().replace("{{BODY}}", html_body)
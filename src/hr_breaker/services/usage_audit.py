@@ -17,6 +17,14 @@ def tokens_from_run_result(result: Any) -> tuple[int, int]:
         return 0, 0
 
 
+def cached_tokens_from_run_result(result: Any) -> int:
+    """Extract prompt-cache hit tokens (Gemini cached_content_token_count) from AgentRunResult."""
+    try:
+        return int(result.usage().cache_read_tokens or 0)
+    except Exception:
+        return 0
+
+
 async def log_usage_event(
     pool,
     user_id: str | None,
@@ -0,0 +1,176 @@
+"""Tests for job posting parsing: interning, batching and the explicit context cache."""
+
+import asyncio
+import sys
+
+import pytest
+from google import genai
+from pydantic_ai.exceptions import ModelHTTPError
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hr_breaker.agents import job_parser
+from hr_breaker.models import JobPosting
+
+
+def _agent_returning(output):
+    agent = MagicMock()
+    agent.run = AsyncMock(return_value=MagicMock(output=output))
+    return agent
+
+
+def test_batch_prompt_numbers_postings():
+    prompt = job_parser._format_batch_prompt(["first", "second"])
+    assert prompt == "Posting 1:\nfirst\n\nPosting 2:\nsecond"
+    assert "Posting <n>:" in job_parser.BATCH_SYSTEM_PROMPT
+    assert "one job posting" not in job_parser.BATCH_SYSTEM_PROMPT
+
+
+def test_finalize_interns_keywords_and_requirements():
+    keyword = "".join(["Dock", "er"])
+    requirement = "".join(["3+ years ", "Python"])
+    assert keyword is not sys.intern("Docker")
+
+    job = job_parser._finalize_job(
+        JobPosting(title="t", keywords=[keyword], requirements=[requirement]), "raw"
+    )
+    assert job.raw_text == "raw"
+    assert job.keywords[0] is sys.intern("Docker")
+    assert job.requirements[0] is sys.intern("3+ years Python")
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_one_request_and_keeps_order():
+    # Strings built at runtime: equal but distinct objects until interned.
+    agent = _agent_returning(
+        [
+            JobPosting(title="A", keywords=["".join(["Py", "thon"])]),
+            JobPosting(title="B", keywords=["".join(["Py", "thon"])]),
+        ]
+    )
+    with patch.object(job_parser, "get_batch_job_parser_agent", return_value=agent):
+        jobs = await job_parser.parse_job_postings_batch(["text a", "text b"])
+
+    agent.run.assert_awaited_once()
+    assert [j.title for j in jobs] == ["A", "B"]
+    assert [j.raw_text for j in jobs] == ["text a", "text b"]
+    assert jobs[0].keywords[0] is jobs[1].keywords[0]
+
+
+@pytest.mark.asyncio
+async def test_batch_count_mismatch_falls_back_to_single_parses():
+    agent = _agent_returning([JobPosting(title="only one")])
+    single = AsyncMock(side_effect=lambda text, audit_user_id=None: JobPosting(title=text))
+    with (
+        patch.object(job_parser, "get_batch_job_parser_agent", return_value=agent),
+        patch.object(job_parser, "parse_job_posting", single),
+    ):
+        jobs = await job_parser.parse_job_postings_batch(["x", "y"])
+
+    assert [j.title for j in jobs] == ["x", "y"]
+    assert single.await_count == 2
+
+
+# --- Explicit context cache ---
+
+MODEL = "gemini-test-flash"
+
+
+@pytest.fixture
+def explicit_cache(monkeypatch):
+    """Explicit caching enabled against a mocked genai.Client; yields the caches.create mock."""
+    monkeypatch.setattr(job_parser, "_explicit_cache", {})
+    monkeypatch.setattr(job_parser, "_explicit_cache_failed_at", {})
+    settings = MagicMock(
+        gemini_explicit_cache=True, google_api_key="test-key", gemini_explicit_cache_ttl_seconds=1000
+    )
+    monkeypatch.setattr(job_parser, "get_settings", lambda: settings)
+    create = AsyncMock(return_value=MagicMock())
+    create.return_value.name = "cachedContents/abc"
+    client = MagicMock()
+    client.aio.caches.create = create
+    monkeypatch.setattr(genai, "Client", MagicMock(return_value=client))
+    return create
+
+
+def _clock(monkeypatch, start: float = 1000.0) -> list[float]:
+    now = [start]
+    monkeypatch.setattr(job_parser.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.asyncio
+async def test_explicit_cache_reused_until_local_expiry(explicit_cache, monkeypatch):
+    now = _clock(monkeypatch)
+
+    assert await job_parser._get_explicit_cache_name(MODEL) == "cachedContents/abc"
+    now[0] += 1000 * 0.9 - 1
+    assert await job_parser._get_explicit_cache_name(MODEL) == "cachedContents/abc"
+    assert explicit_cache.await_count == 1
+
+    # Refreshed at ttl * 0.9, before the server-side TTL runs out
+    now[0] += 2
+    await job_parser._get_explicit_cache_name(MODEL)
+    assert explicit_cache.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_explicit_cache_failure_backs_off(explicit_cache, monkeypatch):
+    now = _clock(monkeypatch)
+    explicit_cache.side_effect = RuntimeError("quota")
+
+    assert await job_parser._get_explicit_cache_name(MODEL) is None
+    assert job_parser._explicit_cache_failed_at[MODEL] == now[0]
+    now[0] += job_parser._EXPLICIT_CACHE_RETRY_AFTER - 1
+    assert await job_parser._get_explicit_cache_name(MODEL) is None
+    assert explicit_cache.await_count == 1
+
+    now[0] += 2
+    explicit_cache.side_effect = None
+    assert await job_parser._get_explicit_cache_name(MODEL) == "cachedContents/abc"
+    assert explicit_cache.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [403, 404])
+async def test_gone_explicit_cache_is_evicted_and_falls_back_inline(explicit_cache, status):
+    cached_agent = MagicMock()
+    cached_agent.run = AsyncMock(side_effect=ModelHTTPError(status_code=status, model_name=MODEL, body=None))
+    inline_agent = _agent_returning(JobPosting(title="inline"))
+    with (
+        patch.object(job_parser, "get_cached_job_parser_agent", return_value=cached_agent),
+        patch.object(job_parser, "get_job_parser_agent", return_value=inline_agent),
+    ):
+        result = await job_parser._run_job_parser("job text", MODEL)
+
+    assert result.output.title == "inline"
+    assert cached_agent.run.await_args.kwargs["model_settings"] == {"google_cached_content": "cachedContents/abc"}
+    inline_agent.run.assert_awaited_once_with("job text")
+    assert MODEL not in job_parser._explicit_cache
+
+
+@pytest.mark.asyncio
+async def test_other_explicit_cache_errors_are_raised(explicit_cache):
+    cached_agent = MagicMock()
+    cached_agent.run = AsyncMock(side_effect=ModelHTTPError(status_code=500, model_name=MODEL, body=None))
+    inline_agent = _agent_returning(JobPosting(title="inline"))
+    with (
+        patch.object(job_parser, "get_cached_job_parser_agent", return_value=cached_agent),
+        patch.object(job_parser, "get_job_parser_agent", return_value=inline_agent),
+        pytest.raises(ModelHTTPError),
+    ):
+        await job_parser._run_job_parser("job text", MODEL)
+
+    inline_agent.run.assert_not_awaited()
+    assert MODEL in job_parser._explicit_cache
+
+
+def test_explicit_cache_lock_follows_running_loop():
+    async def lock():
+        return job_parser._get_explicit_cache_lock()
+
+    async def same_loop_twice():
+        return await lock(), await lock()
+
+    first, again = asyncio.run(same_loop_twice())
+    assert first is again
+    assert asyncio.run(lock()) is not first
@@ -30,6 +30,21 @@ def test_resume_source_checksum_stable():
     assert source1.checksum == source2.checksum
 
 
+def test_resume_source_checksum_follows_content():
+    content = "test content"
+    expected = ResumeSource(content=content).checksum
+
+    # A checksum arriving with external data is never trusted
+    assert ResumeSource.model_validate({"content": content, "checksum": "bogus"}).checksum == expected
+    source = ResumeSource(content=content)
+    assert source.model_dump()["checksum"] == expected
+
+    changed = ResumeSource(content="changed").checksum
+    assert source.model_copy(update={"content": "changed"}).checksum == changed
+    source.content = "changed"
+    assert source.checksum == changed
+
+
 def test_resume_source_legacy_latex_field():
     """Test backward compatibility with old 'latex' field name."""
     # Old cache files have 'latex' instead of 'content'
@@ -0,0 +1,12 @@
+"""Tests for the name extractor agent cache."""
+
+from hr_breaker.agents.name_extractor import get_name_extractor_agent
+
+
+def test_agent_cached_per_model(monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    get_name_extractor_agent.cache_clear()
+    first = get_name_extractor_agent("gemini-a")
+    assert get_name_extractor_agent("gemini-a") is first
+    assert get_name_extractor_agent("gemini-b") is not first
+    get_name_extractor_agent.cache_clear()
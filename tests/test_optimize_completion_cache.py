@@ -0,0 +1,120 @@
+"""/optimize completion cache: key inputs, stored copy, stale PDF eviction, entitlement gating."""
+
+from contextlib import contextmanager
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hr_breaker import api
+from hr_breaker.api import (
+    JobPostingOut,
+    OptimizeRequest,
+    OptimizeResponse,
+    ValidationResultOut,
+    _optimize_cache_hit,
+    _optimize_cache_key,
+    _optimize_cache_set,
+)
+
+
+def _key(req: OptimizeRequest, **overrides) -> str:
+    kwargs = {
+        "user_id": "u1",
+        "source_checksum": "abc",
+        "job_text": "job",
+        "output_language": "en",
+    }
+    kwargs.update(overrides)
+    return _optimize_cache_key(req, **kwargs)
+
+
+def _response() -> OptimizeResponse:
+    return OptimizeResponse(
+        success=True,
+        pdf_base64="cGRm",
+        pdf_filename="resume.pdf",
+        validation=ValidationResultOut(passed=True, results=[]),
+        job=JobPostingOut(title="t", company="c", requirements=[], keywords=[], description=""),
+    )
+
+
+def test_key_covers_user_resume_job_and_options():
+    req = OptimizeRequest(resume_content="r")
+    base = _key(req)
+    assert base == _key(req)
+    assert base != _key(req, user_id="u2")
+    assert base != _key(req, source_checksum="def")
+    assert base != _key(req, job_text="other job")
+    assert base != _key(req, output_language="de")
+    assert base != _key(OptimizeRequest(resume_content="r", aggressive_tailoring=True))
+    assert base != _key(OptimizeRequest(resume_content="r", pre_ats_score=40))
+    assert base != _key(OptimizeRequest(resume_content="r", pre_keyword_score=0.4))
+
+
+@pytest.mark.asyncio
+async def test_hit_rereads_pdf_and_evicts_when_record_is_gone(tmp_path):
+    api._optimize_cache.clear()
+    pdf_path = tmp_path / "resume.pdf"
+    pdf_path.write_bytes(b"pdf")
+    key = _key(OptimizeRequest(resume_content="r"))
+    _optimize_cache_set(
+        key, _response().model_copy(update={"snapshot_url": "https://x/optimize?resume=t", "snapshot_expires_at": "z"})
+    )
+    stored = api._optimize_cache[key][0]
+    assert stored.pdf_base64 is None
+    assert stored.snapshot_url is None and stored.snapshot_expires_at is None
+
+    lookup = AsyncMock(return_value=MagicMock(path=pdf_path))
+    with patch.object(api.pdf_storage, "get_record_by_filename_async", lookup):
+        plain = await _optimize_cache_hit(key, OptimizeRequest(resume_content="r"), "u1")
+        inline = await _optimize_cache_hit(
+            key, OptimizeRequest(resume_content="r", include_pdf_base64=True), "u1"
+        )
+    assert plain.pdf_base64 is None
+    assert inline.pdf_base64 == "cGRm"
+
+    pdf_path.unlink()
+    with patch.object(api.pdf_storage, "get_record_by_filename_async", lookup):
+        assert await _optimize_cache_hit(key, OptimizeRequest(resume_content="r"), "u1") is None
+    assert key not in api._optimize_cache
+
+
+
+@contextmanager
+def _run_optimize_mocks(*, can_export: bool, hit: OptimizeResponse | None):
+    """Stub DB/settings; name extraction fails so a miss stops right after the lookup."""
+    hit_mock = AsyncMock(return_value=hit)
+    name_mock = AsyncMock(side_effect=RuntimeError("stop after lookup"))
+    log_mock = AsyncMock()
+    with (
+        patch.object(api, "get_settings", return_value=MagicMock(google_api_key="test-key")),
+        patch.object(api, "get_pool", AsyncMock(return_value=None)),
+        patch.object(api, "_user_can_export_pdf", AsyncMock(return_value=can_export)),
+        patch.object(api, "_optimize_cache_hit", hit_mock),
+        patch.object(api, "extract_name", name_mock),
+        patch.object(api, "log_usage_event", log_mock),
+    ):
+        yield hit_mock, name_mock, log_mock
+
+
+@pytest.mark.asyncio
+async def test_run_optimize_skips_cache_for_users_who_cannot_export():
+    with _run_optimize_mocks(can_export=False, hit=_response()) as (hit_mock, name_mock, _):
+        out = await api._run_optimize(OptimizeRequest(resume_content="no export resume", job_text="job"))
+
+    hit_mock.assert_not_awaited()
+    name_mock.assert_awaited_once()
+    assert out.success is False
+
+
+@pytest.mark.asyncio
+async def test_run_optimize_hit_skips_pipeline_and_logs_usage():
+    with _run_optimize_mocks(can_export=True, hit=_response()) as (hit_mock, name_mock, log_mock):
+        out = await api._run_optimize(OptimizeRequest(resume_content="cached resume", job_text="job"))
+
+    hit_mock.assert_awaited_once()
+    name_mock.assert_not_called()
+    assert out.pdf_filename == "resume.pdf"
+    log_mock.assert_awaited_once()
+    assert log_mock.await_args.args[2] == "optimize_complete"
+    assert log_mock.await_args.kwargs["metadata"]["completion_cache"] is True
@@ -0,0 +1,79 @@
+"""/optimize: name extraction overlaps the job scrape and is discarded on early exits."""
+
+import asyncio
+from contextlib import contextmanager
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hr_breaker import api
+from hr_breaker.api import OptimizeRequest
+
+JOB_URL = "https://example.com/jobs/view/123"
+
+
+class _SlowNameExtraction:
+    """extract_name stand-in that blocks until cancelled, recording both events."""
+
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def __call__(self, content, audit_user_id=None):
+        self.started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+@contextmanager
+def _optimize_mocks(name: _SlowNameExtraction, scrape, cache_hit=None):
+    with (
+        patch.object(api, "get_settings", return_value=MagicMock(google_api_key="test-key")),
+        patch.object(api, "get_pool", AsyncMock(return_value=None)),
+        patch.object(api, "log_usage_event", AsyncMock()),
+        patch.object(api, "_user_can_export_pdf", AsyncMock(return_value=True)),
+        patch.object(api, "_optimize_cache_hit", cache_hit or AsyncMock(return_value=None)),
+        patch.object(api, "extract_name", name),
+        patch.object(api, "cached_scrape", scrape),
+    ):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_name_extraction_runs_during_scrape_and_is_discarded_on_failure():
+    name = _SlowNameExtraction()
+
+    async def scrape(url):
+        # The name task is already running while the scrape is in flight.
+        await asyncio.wait_for(name.started.wait(), timeout=1)
+        raise RuntimeError("scrape failed")
+
+    with _optimize_mocks(name, scrape):
+        out = await api._run_optimize(OptimizeRequest(resume_content="overlap resume", job_url=JOB_URL))
+        await asyncio.sleep(0)
+
+    assert out.success is False
+    assert out.error == "scrape failed"
+    assert name.cancelled
+
+
+@pytest.mark.asyncio
+async def test_failing_completion_cache_lookup_discards_name_task():
+    name = _SlowNameExtraction()
+    lookup = AsyncMock(side_effect=RuntimeError("storage down"))
+
+    async def scrape(url):
+        await asyncio.sleep(0)  # let the name task start
+        return "job text"
+
+    with _optimize_mocks(name, scrape, cache_hit=lookup):
+        with pytest.raises(RuntimeError, match="storage down"):
+            await api._run_optimize(OptimizeRequest(resume_content="lookup resume", job_url=JOB_URL))
+        await asyncio.sleep(0)
+
+    lookup.assert_awaited_once()
+    assert name.started.is_set()
+    assert name.cancelled
@@ -0,0 +1,11 @@
+"""Tests for parse cache keys."""
+
+from hr_breaker.agents._parse_cache import cache_key
+
+
+def test_cache_key_depends_on_all_inputs():
+    base = cache_key("m", "prompt", "text")
+    assert base == cache_key("m", "prompt", "text")
+    assert base != cache_key("m2", "prompt", "text")
+    assert base != cache_key("m", "prompt2", "text")
+    assert base != cache_key("m", "prompt", "text2")
@@ -48,3 +48,9 @@ def test_extract_text_multipage(tmp_path):
     text = extract_text_from_pdf(pdf_path)
     assert "Page 1 content" in text
     assert "Page 2 content" in text
+
+
+def test_extract_text_from_pdf_bytes_input(sample_pdf):
+    text = extract_text_from_pdf(sample_pdf.read_bytes())
+    assert "John Doe" in text
+    assert "Django" in text
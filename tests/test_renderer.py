@@ -1,5 +1,9 @@
 """Tests for the renderer module."""
 
+import asyncio
+import threading
+from pathlib import Path
+
 import pytest
 
 from hr_breaker.models.resume_data import (
@@ -10,6 +14,7 @@ from hr_breaker.models.resume_data import (
     Education,
     Project,
 )
+from hr_breaker.services import renderer as renderer_module
 from hr_breaker.services.renderer import (
     BaseRenderer,
     HTMLRenderer,
@@ -148,6 +153,81 @@ class TestGetRenderer:
         renderer = get_renderer()
         assert isinstance(renderer, HTMLRenderer)
 
+    def test_get_renderer_is_shared(self):
+        assert get_renderer() is get_renderer()
+
+
+@pytest.mark.asyncio
+async def test_async_renders_run_on_dedicated_render_thread():
+    # No WeasyPrint needed: bypass __init__ and stub the sync render methods.
+    renderer = HTMLRenderer.__new__(HTMLRenderer)
+    renderer.render = lambda html_body: threading.current_thread().name
+    renderer.render_data = lambda data: threading.current_thread().name
+
+    names = await asyncio.gather(
+        renderer.render_async("<p>a</p>"),
+        renderer.render_async("<p>b</p>"),
+        renderer.render_data_async(None),
+    )
+    assert len(set(names)) == 1
+    assert names[0].startswith("weasyprint")
+
+
+def _template_uri(name: str) -> str:
+    return (Path(str(renderer_module._TEMPLATES)) / name).as_uri()
+
+
+def _counting_fetch(calls: list):
+    def fetch(url):
+        calls.append(url)
+        return {"string": b"body", "url": url}
+
+    return fetch
+
+
+def test_fetch_cache_hit_for_template_files():
+    renderer_module._fetch_cache.clear()
+    calls = []
+    url = _template_uri("resume_wrapper.html")
+
+    first = renderer_module._fetch_through_cache(url, _counting_fetch(calls))
+    second = renderer_module._fetch_through_cache(url, _counting_fetch(calls))
+    assert first == second
+    assert calls == [url]
+
+
+def test_fetch_cache_skips_remote_and_foreign_files(tmp_path):
+    renderer_module._fetch_cache.clear()
+    outside = tmp_path / "photo.png"
+    outside.write_bytes(b"png")
+    assert renderer_module._is_cacheable_url(_template_uri("resume.html"))
+    assert not renderer_module._is_cacheable_url("https://example.com/photo.png")
+    assert not renderer_module._is_cacheable_url(outside.as_uri())
+    assert not renderer_module._is_cacheable_url(
+        _template_uri("..") + "/services/renderer.py"
+    )
+    assert not renderer_module._is_cacheable_url("data:image/png;base64,AAAA")
+
+
+def test_fetch_cache_evicts_least_recently_used(monkeypatch):
+    renderer_module._fetch_cache.clear()
+    monkeypatch.setattr(renderer_module, "_FETCH_CACHE_MAXSIZE", 2)
+    calls = []
+    fetch = _counting_fetch(calls)
+    first, second, third = (
+        _template_uri(name) for name in ("resume.html", "resume_wrapper.html", "resume_guide.md")
+    )
+
+    renderer_module._fetch_through_cache(first, fetch)
+    renderer_module._fetch_through_cache(second, fetch)
+    renderer_module._fetch_through_cache(first, fetch)  # first is now most recent
+    renderer_module._fetch_through_cache(third, fetch)
+    assert list(renderer_module._fetch_cache) == [first, third]
+
+    renderer_module._fetch_through_cache(second, fetch)
+    assert calls == [first, second, third, second]
+    renderer_module._fetch_cache.clear()
+
 
 # --- HTMLRenderer Tests ---
 
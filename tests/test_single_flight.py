@@ -0,0 +1,90 @@
+"""Tests for the single-flight async cache."""
+
+import asyncio
+
+import pytest
+
+from hr_breaker.services.single_flight import SingleFlightCache
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_run():
+    cache: SingleFlightCache[str] = SingleFlightCache()
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "parsed"
+
+    results = await asyncio.gather(*(cache.get_or_run("k", factory) for _ in range(5)))
+    assert results == ["parsed"] * 5
+    assert calls == 1
+    assert await cache.get_or_run("k", factory) == "parsed"
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached():
+    cache: SingleFlightCache[str] = SingleFlightCache()
+    attempts = 0
+
+    async def flaky():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RuntimeError("boom")
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_run("k", flaky)
+    assert len(cache) == 0
+    assert await cache.get_or_run("k", flaky) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_ttl_and_lru_eviction():
+    cache: SingleFlightCache[int] = SingleFlightCache(maxsize=2, ttl=0.0)
+
+    async def one():
+        return 1
+
+    async def two():
+        return 2
+
+    await cache.get_or_run("a", one)
+    await asyncio.sleep(0.001)
+    # Expired entry is recomputed
+    assert await cache.get_or_run("a", two) == 2
+
+    lru: SingleFlightCache[int] = SingleFlightCache(maxsize=2)
+    for key in ("a", "b", "c"):
+        await lru.get_or_run(key, one)
+    assert len(lru) == 2
+    assert await lru.get_or_run("a", two) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_other_waiters():
+    cache: SingleFlightCache[str] = SingleFlightCache()
+    release = asyncio.Event()
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "parsed"
+
+    first = asyncio.create_task(cache.get_or_run("k", factory))
+    second = asyncio.create_task(cache.get_or_run("k", factory))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == "parsed"
+    assert first.cancelled()
+    assert calls == 1
+    assert await cache.get_or_run("k", factory) == "parsed"